@@ -1,27 +1,244 @@
-from dataclasses import dataclass
+import math
+import os
+import struct
+import sys
+from collections import deque
+from dataclasses import MISSING, dataclass, fields
 from datetime import datetime
-from typing import Optional, UUID
+from typing import Optional
+from uuid import UUID
 
-@dataclass
-class Photo:
+# Fixed-size record header used by Photo.pack/unpack: id bytes, capture time
+# in nanoseconds since the epoch, latitude, longitude (NaN when unknown),
+# flags, file path length, camera model length and tag count.
+_PACK_HEADER = struct.Struct("<16sqddBIIH")
+_PACK_TAG_LENGTH = struct.Struct("<H")
+_HAS_CAMERA_MODEL = 0x01
+
+class _PhotoMemo:
+    """
+    Slots for values Photo memoizes, kept out of the dataclass fields so they
+    never show up in fields(), asdict() or astuple().
+    
+    Slots leave no __dict__ for functools.cached_property to use. Unset slots
+    read as missing, so properties look them up with getattr defaults.
+    """
+    # Memoized (file_path, directory) pair backing `directory` and
+    # (capture_timestamp_ns, datetime) pair backing `capture_timestamp`
+    __slots__ = ("_directory_cache", "_timestamp_cache")
+
+@dataclass(slots=True)
+class Photo(_PhotoMemo):
     """
     Domain model representing a photo entity.
     Follows clean architecture principles with immutable data representation.
     """
     id: UUID
     file_path: str
-    capture_timestamp: datetime
+    capture_timestamp_ns: int
     camera_model: Optional[str] = None
     latitude: Optional[float] = None
     longitude: Optional[float] = None
-    tags: list[str] = None
+    tags: tuple[str, ...] = ()
 
     def __post_init__(self):
         """
         Validate photo attributes after initialization.
+        
+        Validation is skipped when Python runs with -O, which bulk-ingest
+        pipelines can use to drop the check from the hot path.
+        """
+        if __debug__:
+            _validate_path(self.file_path)
+        
+        # Tag vocabularies are small, so share one string object per tag.
+        # Any iterable is accepted and stored as an immutable tuple.
+        self.tags = tuple(map(sys.intern, self.tags))
+
+    @property
+    def directory(self) -> str:
+        """
+        Directory containing the photo file, computed once per file path.
+        """
+        cached = getattr(self, "_directory_cache", None)
+        if cached is None or cached[0] is not self.file_path:
+            cached = (self.file_path, os.path.dirname(self.file_path))
+            self._directory_cache = cached
+        return cached[1]
+
+    @property
+    def capture_timestamp(self) -> datetime:
+        """
+        Capture time as a local datetime, materialized on first access.
+        """
+        cached = getattr(self, "_timestamp_cache", None)
+        if cached is None or cached[0] != self.capture_timestamp_ns:
+            cached = (
+                self.capture_timestamp_ns,
+                _datetime_from_ns(self.capture_timestamp_ns)
+            )
+            self._timestamp_cache = cached
+        return cached[1]
+
+    @property
+    def year(self) -> int:
+        """
+        Calendar year the photo was captured in, for grouping.
+        """
+        return self.capture_timestamp.year
+
+    def pack(self) -> bytes:
+        """
+        Serialize the photo into a compact binary record.
+        
+        Intended for repositories writing photos to disk or over the wire in
+        place of pickle; reverse with Photo.unpack.
+        
+        Returns:
+            bytes: The encoded record
+        """
+        file_path = self.file_path.encode("utf-8")
+        camera_model = (self.camera_model or "").encode("utf-8")
+        
+        parts = [
+            _PACK_HEADER.pack(
+                self.id.bytes,
+                self.capture_timestamp_ns,
+                math.nan if self.latitude is None else self.latitude,
+                math.nan if self.longitude is None else self.longitude,
+                _HAS_CAMERA_MODEL if self.camera_model is not None else 0,
+                len(file_path),
+                len(camera_model),
+                len(self.tags)
+            ),
+            file_path,
+            camera_model
+        ]
+        for tag in self.tags:
+            encoded = tag.encode("utf-8")
+            parts.append(_PACK_TAG_LENGTH.pack(len(encoded)))
+            parts.append(encoded)
+        
+        return b"".join(parts)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "Photo":
+        """
+        Rebuild a photo from a record produced by Photo.pack.
+        
+        Args:
+            data (bytes): The encoded record
+        
+        Returns:
+            Photo: The decoded photo
         """
-        if not self.file_path:
-            raise ValueError("Photo must have a valid file path")
+        view = memoryview(data)
+        (
+            id_bytes, timestamp_ns, latitude, longitude, flags,
+            path_length, model_length, tag_count
+        ) = _PACK_HEADER.unpack_from(view)
+        offset = _PACK_HEADER.size
         
-        if self.tags is None:
-            self.tags = []
\ No newline at end of file
+        file_path = str(view[offset:offset + path_length], "utf-8")
+        offset += path_length
+        camera_model = str(view[offset:offset + model_length], "utf-8")
+        offset += model_length
+        
+        tags = []
+        for _ in range(tag_count):
+            (tag_length,) = _PACK_TAG_LENGTH.unpack_from(view, offset)
+            offset += _PACK_TAG_LENGTH.size
+            tags.append(str(view[offset:offset + tag_length], "utf-8"))
+            offset += tag_length
+        
+        return cls(
+            id=UUID(bytes=bytes(id_bytes)),
+            file_path=file_path,
+            capture_timestamp_ns=timestamp_ns,
+            camera_model=camera_model if flags & _HAS_CAMERA_MODEL else None,
+            latitude=None if math.isnan(latitude) else latitude,
+            longitude=None if math.isnan(longitude) else longitude,
+            tags=tags
+        )
+
+
+def _datetime_from_ns(timestamp_ns: int) -> datetime:
+    """
+    Convert nanoseconds since the epoch to a local datetime without float rounding.
+    """
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+
+def _validate_path(file_path: str) -> None:
+    """
+    Ensure a photo file path is usable.
+    """
+    if not file_path:
+        raise ValueError("Photo must have a valid file path")
+
+
+def _build_fast_constructor():
+    """
+    Generate a positional, validation-free Photo constructor.
+    
+    The dataclass __init__ and __post_init__ are bypassed entirely: the
+    generated function allocates with object.__new__ and writes each slot
+    directly. Intended for trusted bulk paths whose inputs were already
+    verified upstream. Generated from the dataclass fields so it stays in
+    sync with the model.
+    """
+    namespace = {"_new": object.__new__, "Photo": Photo}
+    params = []
+    body = ["    photo = _new(Photo)"]
+    for f in fields(Photo):
+        if f.init:
+            if f.default is MISSING:
+                params.append(f.name)
+            else:
+                namespace[f"_default_{f.name}"] = f.default
+                params.append(f"{f.name}=_default_{f.name}")
+            body.append(f"    photo.{f.name} = {f.name}")
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            body.append(f"    photo.{f.name} = _factory_{f.name}()")
+        else:
+            namespace[f"_default_{f.name}"] = f.default
+            body.append(f"    photo.{f.name} = _default_{f.name}")
+    body.append("    return photo")
+    
+    source = f"def fast({', '.join(params)}):\n" + "\n".join(body) + "\n"
+    exec(source, namespace)
+    return namespace["fast"]
+
+
+Photo.fast = staticmethod(_build_fast_constructor())
+
+
+# Recycled Photo shells for churn-heavy callers; see acquire_photo/release_photo
+_POOL: "deque[Photo]" = deque(maxlen=4096)
+
+
+def acquire_photo(**kwargs) -> Photo:
+    """
+    Build a photo, reusing a released instance when one is available.
+    
+    Accepts the same keyword arguments as the Photo constructor; all fields
+    are reinitialized and validated as for a fresh instance.
+    """
+    try:
+        photo = _POOL.pop()
+    except IndexError:
+        return Photo(**kwargs)
+    
+    photo.__init__(**kwargs)
+    return photo
+
+
+def release_photo(photo: Photo) -> None:
+    """
+    Return a photo to the pool for reuse by acquire_photo.
+    
+    The caller must not hold any other reference to the photo afterwards.
+    """
+    _POOL.append(photo)
\ No newline at end of file
@@ -1,14 +1,53 @@
-from abc import ABC, abstractmethod
-from typing import List, Optional, UUID
+from dataclasses import FrozenInstanceError
+from typing import ClassVar, Dict, Final, Iterator, List, Optional, Protocol, Sequence
+from uuid import UUID
 from src.domain.models.photo import Photo
 
-class PhotoRepository(ABC):
+class _ReadOnlyPhoto(Photo):
     """
-    Abstract base class defining the contract for photo repository operations.
-    Follows dependency inversion principle.
+    Photo whose fields cannot be reassigned once it has been constructed.
+    
+    Private memo slots stay writable so cached properties keep working.
     """
     
-    @abstractmethod
+    __slots__ = ("_sealed",)
+    
+    def __post_init__(self):
+        super().__post_init__()
+        object.__setattr__(self, "_sealed", True)
+    
+    def __setattr__(self, name, value):
+        if not name.startswith("_") and getattr(self, "_sealed", False):
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+        super().__setattr__(name, value)
+    
+    def __delattr__(self, name):
+        if getattr(self, "_sealed", False):
+            raise FrozenInstanceError(f"cannot delete field {name!r}")
+        super().__delattr__(name)
+
+
+# Shared placeholder returned by find_by_id_or_missing for absent photos.
+# Compare with `is`; it is read-only and must never be saved.
+MISSING_PHOTO: Final[Photo] = _ReadOnlyPhoto(
+    id=UUID(int=0),
+    file_path="/dev/null",
+    capture_timestamp_ns=0
+)
+
+class PhotoRepository(Protocol):
+    """
+    Protocol defining the contract for photo repository operations.
+    Follows dependency inversion principle; implementations are matched
+    structurally and only need to subclass it to inherit the default
+    batch and lookup helpers.
+    """
+    
+    # Whether save() returns the photo it was given unchanged, which lets
+    # callers persist in the background and hand the photo back immediately.
+    # Repositories opt in by setting this to True.
+    supports_client_ids: ClassVar[bool] = False
+    
     def save(self, photo: Photo) -> Photo:
         """
         Save a new photo to the repository.
@@ -19,9 +58,24 @@ class PhotoRepository(ABC):
         Returns:
             Photo: The saved photo with potential modifications
         """
-        pass
+        ...
+
+    def save_many(self, photos: List[Photo]) -> List[Photo]:
+        """
+        Save several photos in one call.
+        
+        The default implementation saves each photo individually; concrete
+        repositories should override it to coalesce the writes into a single
+        transaction.
+        
+        Args:
+            photos (List[Photo]): The photos to be saved
+        
+        Returns:
+            List[Photo]: The saved photos, in the same order
+        """
+        return [self.save(photo) for photo in photos]
 
-    @abstractmethod
     def find_by_id(self, photo_id: UUID) -> Optional[Photo]:
         """
         Retrieve a photo by its unique identifier.
@@ -32,9 +86,56 @@ class PhotoRepository(ABC):
         Returns:
             Optional[Photo]: The found photo or None
         """
-        pass
+        ...
+
+    def find_by_id_or_missing(self, photo_id: UUID) -> Photo:
+        """
+        Retrieve a photo by its unique identifier, or the MISSING_PHOTO sentinel.
+        
+        Args:
+            photo_id (UUID): Unique identifier of the photo
+        
+        Returns:
+            Photo: The found photo, or MISSING_PHOTO if absent
+        """
+        photo = self.find_by_id(photo_id)
+        return MISSING_PHOTO if photo is None else photo
+
+    def find_by_ids(self, photo_ids: Sequence[UUID]) -> Dict[UUID, Photo]:
+        """
+        Retrieve several photos by their unique identifiers in one call.
+        
+        The default implementation looks each photo up individually; concrete
+        repositories should override it with a single batched query.
+        
+        Args:
+            photo_ids (Sequence[UUID]): Unique identifiers of the photos
+        
+        Returns:
+            Dict[UUID, Photo]: Found photos keyed by ID; missing IDs are omitted
+        """
+        found = {}
+        for photo_id in photo_ids:
+            photo = self.find_by_id(photo_id)
+            if photo is not None:
+                found[photo_id] = photo
+        return found
+
+    def iter_by_tag(self, tag: str) -> Iterator[Photo]:
+        """
+        Lazily yield photos matching a specific tag.
+        
+        Implementations should stream results (e.g. page through a cursor)
+        rather than materializing the full result set.
+        
+        Args:
+            tag (str): Tag to search for
+        
+        Returns:
+            Iterator[Photo]: Photos with the specified tag
+        """
+        ...
 
-    @abstractmethod
     def find_by_tag(self, tag: str) -> List[Photo]:
         """
         Find photos matching a specific tag.
@@ -45,9 +146,33 @@ class PhotoRepository(ABC):
         Returns:
             List[Photo]: List of photos with the specified tag
         """
-        pass
+        return list(self.iter_by_tag(tag))
+
+    def find_ids_by_tag(self, tag: str) -> List[UUID]:
+        """
+        Find the IDs of photos matching a specific tag.
+        
+        The default implementation streams full photos via iter_by_tag;
+        concrete repositories should override it to answer from a tag index
+        without rehydrating photo objects.
+        
+        Args:
+            tag (str): Tag to search for
+        
+        Returns:
+            List[UUID]: IDs of photos with the specified tag
+        """
+        return [photo.id for photo in self.iter_by_tag(tag)]
+
+    def list_photos(self) -> Iterator[Photo]:
+        """
+        List all photos in the repository.
+        
+        Returns:
+            Iterator[Photo]: All photos in the repository
+        """
+        ...
 
-    @abstractmethod
     def delete(self, photo_id: UUID) -> bool:
         """
         Delete a photo from the repository.
@@ -58,4 +183,19 @@ class PhotoRepository(ABC):
         Returns:
             bool: Whether deletion was successful
         """
-        pass
\ No newline at end of file
+        ...
+
+    def delete_many(self, photo_ids: Sequence[UUID]) -> Dict[UUID, bool]:
+        """
+        Delete several photos from the repository in one call.
+        
+        The default implementation deletes each photo individually; concrete
+        repositories should override it with a single batched operation.
+        
+        Args:
+            photo_ids (Sequence[UUID]): Unique identifiers of the photos to delete
+        
+        Returns:
+            Dict[UUID, bool]: Whether deletion was successful, keyed by ID
+        """
+        return {photo_id: self.delete(photo_id) for photo_id in photo_ids}
\ No newline at end of file
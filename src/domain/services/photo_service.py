@@ -1,9 +1,15 @@
+import functools
+import sys
+import threading
+import time
 import uuid
-from datetime import datetime
-from typing import List, Optional
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from src.domain.models.photo import Photo
-from src.domain.repositories.photo_repository import PhotoRepository
+from src.domain.repositories.photo_repository import MISSING_PHOTO, PhotoRepository
 
 class PhotoService:
     """
@@ -11,6 +17,11 @@ class PhotoService:
     Coordinates between domain models and repository.
     """
     
+    # Maximum number of photos kept in the in-process read cache
+    _CACHE_MAX = 1024
+    # Number of per-photo lock stripes; must be a power of two
+    _LOCK_STRIPES = 64
+    
     def __init__(self, photo_repository: PhotoRepository):
         """
         Initialize photo service with a repository.
@@ -19,20 +30,112 @@ class PhotoService:
             photo_repository (PhotoRepository): Repository for photo operations
         """
         self._repository = photo_repository
+        self._photo_cache: "OrderedDict[uuid.UUID, Photo]" = OrderedDict()
+        # A single worker keeps background saves in submission order
+        self._saver = ThreadPoolExecutor(max_workers=1)
+        # Background saves still running or failed; successful ones drop out
+        self._pending_saves: List[Future] = []
+        # Latest unfinished background save per photo, so later writes to
+        # the same photo can wait for it
+        self._saves_in_flight: Dict[uuid.UUID, Future] = {}
+        # Inverted index of tag -> photo IDs for photos seen by this service
+        self._tag_index: Dict[str, Set[uuid.UUID]] = defaultdict(set)
+        # Guards the cache, tag index and pending saves; never held across
+        # repository calls
+        self._state_lock = threading.Lock()
+        # Serializes read-modify-write updates per photo without a global lock
+        self._stripes = [threading.Lock() for _ in range(self._LOCK_STRIPES)]
+
+    def _lock_for(self, photo_id: uuid.UUID) -> threading.Lock:
+        """
+        Return the lock stripe guarding updates to a photo.
+        
+        Args:
+            photo_id (UUID): ID of the photo
+        
+        Returns:
+            threading.Lock: Lock shared by all photos hashing to the same stripe
+        """
+        return self._stripes[hash(photo_id) & (self._LOCK_STRIPES - 1)]
+
+    def _get(self, photo_id: uuid.UUID) -> Photo:
+        """
+        Retrieve a photo, serving repeated reads from the LRU cache.
+        
+        Args:
+            photo_id (UUID): ID of the photo to retrieve
+        
+        Returns:
+            Photo: The found photo or MISSING_PHOTO
+        """
+        with self._state_lock:
+            photo = self._photo_cache.get(photo_id)
+            if photo is not None:
+                self._photo_cache.move_to_end(photo_id)
+                return photo
+        
+        photo = self._repository.find_by_id_or_missing(photo_id)
+        if photo is not MISSING_PHOTO:
+            self._remember(photo)
+        
+        return photo
+
+    def _remember(self, photo: Photo) -> None:
+        """
+        Store a photo in the LRU cache, evicting the least recently used entry.
+        
+        Args:
+            photo (Photo): Photo to cache
+        """
+        with self._state_lock:
+            self._photo_cache[photo.id] = photo
+            self._photo_cache.move_to_end(photo.id)
+            
+            if len(self._photo_cache) > self._CACHE_MAX:
+                self._photo_cache.popitem(last=False)
+
+    def _index_tags(self, photo_id: uuid.UUID, tags: Iterable[str]) -> None:
+        """
+        Record a photo under each of the given tags in the tag index.
+        
+        Args:
+            photo_id (UUID): ID of the tagged photo
+            tags (Iterable[str]): Tags to index the photo under
+        """
+        with self._state_lock:
+            for tag in tags:
+                self._tag_index[tag].add(photo_id)
+
+    def rebuild_index(self) -> None:
+        """
+        Rebuild the tag index from every photo in the repository.
+        """
+        tag_index: Dict[str, Set[uuid.UUID]] = defaultdict(set)
+        for photo in self._repository.list_photos():
+            for tag in photo.tags:
+                tag_index[tag].add(photo.id)
+        
+        with self._state_lock:
+            self._tag_index = tag_index
 
     def capture_photo(
         self, 
         file_path: str, 
         camera_model: Optional[str] = None, 
-        tags: Optional[List[str]] = None
+        tags: Optional[Iterable[str]] = None
     ) -> Photo:
         """
         Create and save a new photo entry.
         
+        When the repository keeps client-generated photos unchanged, the save
+        runs in the background and the photo is returned immediately; call
+        flush() to wait for pending saves. A photo whose background save fails
+        is dropped from the cache and tag index, and flush() raises the error.
+        
         Args:
             file_path (str): Path to the photo file
             camera_model (Optional[str]): Camera that captured the photo
-            tags (Optional[List[str]]): Optional tags for the photo
+            tags (Optional[Iterable[str]]): Optional tags for the photo
         
         Returns:
             Photo: The newly created and saved photo
@@ -40,30 +143,289 @@ class PhotoService:
         new_photo = Photo(
             id=uuid.uuid4(),
             file_path=file_path,
-            capture_timestamp=datetime.now(),
+            capture_timestamp_ns=time.time_ns(),
             camera_model=camera_model,
-            tags=tags or []
+            tags=tags or ()
         )
         
-        return self._repository.save(new_photo)
+        if getattr(self._repository, "supports_client_ids", False):
+            self._remember(new_photo)
+            self._index_tags(new_photo.id, new_photo.tags)
+            future = self._saver.submit(self._save_in_background, new_photo)
+            with self._state_lock:
+                self._pending_saves.append(future)
+                self._saves_in_flight[new_photo.id] = future
+            future.add_done_callback(
+                functools.partial(self._discard_finished_save, new_photo.id)
+            )
+            return new_photo
+        
+        saved = self._repository.save(new_photo)
+        self._remember(saved)
+        self._index_tags(saved.id, saved.tags)
+        
+        return saved
+
+    def _save_in_background(self, photo: Photo) -> Photo:
+        """
+        Save a photo on the background worker, forgetting it if the save fails.
+        
+        Args:
+            photo (Photo): Photo already cached and indexed by capture_photo()
+        
+        Returns:
+            Photo: The saved photo
+        """
+        try:
+            return self._repository.save(photo)
+        except Exception:
+            with self._state_lock:
+                if self._photo_cache.get(photo.id) is photo:
+                    del self._photo_cache[photo.id]
+                for tag in photo.tags:
+                    tagged = self._tag_index.get(tag)
+                    if tagged is not None:
+                        tagged.discard(photo.id)
+                        if not tagged:
+                            del self._tag_index[tag]
+            raise
+
+    def _discard_finished_save(self, photo_id: uuid.UUID, future: Future) -> None:
+        """
+        Stop tracking a finished background save.
+        
+        Failed saves stay pending so flush() can report them.
+        
+        Args:
+            photo_id (UUID): ID of the saved photo
+            future (Future): The finished background save
+        """
+        with self._state_lock:
+            if self._saves_in_flight.get(photo_id) is future:
+                del self._saves_in_flight[photo_id]
+            
+            if future.cancelled() or future.exception() is not None:
+                return
+            
+            try:
+                self._pending_saves.remove(future)
+            except ValueError:
+                # Already taken by flush()
+                pass
+
+    def _wait_for_save(self, photo_id: uuid.UUID) -> None:
+        """
+        Wait for a photo's background save so later writes are applied after it.
+        
+        Callers hold the photo's lock stripe. Errors are left for flush().
+        
+        Args:
+            photo_id (UUID): ID of the photo
+        """
+        with self._state_lock:
+            future = self._saves_in_flight.get(photo_id)
+        
+        if future is not None:
+            wait([future])
+
+    def flush(self) -> None:
+        """
+        Wait for all background saves to complete.
+        
+        Raises:
+            Exception: The first error raised by a background save
+        """
+        with self._state_lock:
+            pending, self._pending_saves = self._pending_saves, []
+        wait(pending)
+        for future in pending:
+            future.result()
+
+    def close(self) -> None:
+        """
+        Wait for background saves to finish and stop the background worker.
+        
+        Call flush() first to surface errors from background saves.
+        """
+        self._saver.shutdown(wait=True)
+
+    def capture_photo_batch(
+        self,
+        entries: List[Tuple[str, Optional[str], Optional[Iterable[str]]]]
+    ) -> List[Photo]:
+        """
+        Create and save several new photo entries in one repository call.
+        
+        All photos in the batch share a single capture timestamp. File paths
+        are expected to have been verified by the caller and are not
+        validated again.
+        
+        Args:
+            entries (List[Tuple[str, Optional[str], Optional[Iterable[str]]]]):
+                (file_path, camera_model, tags) for each photo
+        
+        Returns:
+            List[Photo]: The newly created and saved photos
+        """
+        # Bind hot callables locally to skip global/attribute lookups per entry
+        new_id = uuid.uuid4
+        make_photo = Photo.fast
+        intern = sys.intern
+        timestamp_ns = time.time_ns()
+        new_photos = [
+            make_photo(
+                new_id(),
+                file_path,
+                timestamp_ns,
+                camera_model,
+                None,
+                None,
+                tuple(map(intern, tags)) if tags else ()
+            )
+            for file_path, camera_model, tags in entries
+        ]
+        
+        saved_photos = self._repository.save_many(new_photos)
+        for saved in saved_photos:
+            self._remember(saved)
+            self._index_tags(saved.id, saved.tags)
+        
+        return saved_photos
+
+    def get_photos(self, photo_ids: Sequence[uuid.UUID]) -> Dict[uuid.UUID, Photo]:
+        """
+        Retrieve several photos, fetching cache misses in one repository call.
+        
+        Args:
+            photo_ids (Sequence[UUID]): IDs of the photos to retrieve
+        
+        Returns:
+            Dict[UUID, Photo]: Found photos keyed by ID; missing IDs are omitted
+        """
+        found = {}
+        missing = []
+        with self._state_lock:
+            for photo_id in photo_ids:
+                photo = self._photo_cache.get(photo_id)
+                if photo is not None:
+                    self._photo_cache.move_to_end(photo_id)
+                    found[photo_id] = photo
+                else:
+                    missing.append(photo_id)
+        
+        if missing:
+            fetched = self._repository.find_by_ids(missing)
+            for photo in fetched.values():
+                self._remember(photo)
+            found.update(fetched)
+        
+        return found
 
-    def add_photo_tags(self, photo_id: uuid.UUID, tags: List[str]) -> Optional[Photo]:
+    def add_photo_tags(self, photo_id: uuid.UUID, tags: Iterable[str]) -> Optional[Photo]:
         """
         Add tags to an existing photo.
         
+        Concurrent updates to the same photo are serialized; updates to
+        different photos proceed in parallel.
+        
         Args:
             photo_id (UUID): ID of the photo to tag
-            tags (List[str]): Tags to add
+            tags (Iterable[str]): Tags to add
         
         Returns:
             Optional[Photo]: Updated photo or None if not found
         """
-        photo = self._repository.find_by_id(photo_id)
+        with self._lock_for(photo_id):
+            self._wait_for_save(photo_id)
+            photo = self._get(photo_id)
+            
+            if photo is MISSING_PHOTO:
+                return None
+            
+            # Rebuild the tag tuple with only unseen tags appended, preserving order
+            seen = set(photo.tags)
+            added_tags = []
+            for tag in map(sys.intern, tags):
+                if tag not in seen:
+                    seen.add(tag)
+                    added_tags.append(tag)
+            # Update a copy so the cached photo is untouched if the save fails
+            updated = replace(photo, tags=photo.tags + tuple(added_tags))
+            
+            saved = self._repository.save(updated)
+            self._remember(saved)
+            # Index every tag: photos loaded from the repository may not have
+            # been indexed under their existing tags yet
+            self._index_tags(saved.id, saved.tags)
+            
+            return saved
+
+    def find_photo_ids_by_tag(self, tag: str) -> List[uuid.UUID]:
+        """
+        Find the IDs of photos carrying a tag without loading the photos.
+        
+        Args:
+            tag (str): Tag to search for
+        
+        Returns:
+            List[UUID]: IDs of photos with the specified tag
+        """
+        return self._repository.find_ids_by_tag(tag)
+
+    def count_by_tag(self, tag: str) -> int:
+        """
+        Count photos carrying a tag without materializing them all at once.
+        
+        Args:
+            tag (str): Tag to search for
         
-        if not photo:
-            return None
+        Returns:
+            int: Number of photos with the specified tag
+        """
+        return sum(1 for _ in self._repository.iter_by_tag(tag))
+
+    def find_by_tag(self, tag: str) -> List[Photo]:
+        """
+        Find photos carrying a tag using the in-process tag index.
         
-        unique_tags = set(photo.tags + tags)
-        photo.tags = list(unique_tags)
+        Only photos captured or tagged through this service, or loaded by
+        rebuild_index(), are indexed.
         
-        return self._repository.save(photo)
\ No newline at end of file
+        Args:
+            tag (str): Tag to search for
+        
+        Returns:
+            List[Photo]: Photos with the specified tag
+        """
+        with self._state_lock:
+            photo_ids = list(self._tag_index.get(tag, ()))
+        
+        if not photo_ids:
+            return []
+        
+        return list(self.get_photos(photo_ids).values())
+
+    def delete_photo(self, photo_id: uuid.UUID) -> bool:
+        """
+        Delete a photo, dropping it from the cache and tag index.
+        
+        Args:
+            photo_id (UUID): ID of the photo to delete
+        
+        Returns:
+            bool: Whether deletion was successful
+        """
+        with self._lock_for(photo_id):
+            self._wait_for_save(photo_id)
+            with self._state_lock:
+                photo = self._photo_cache.pop(photo_id, None)
+                # Tags of uncached photos are unknown, so scrub the whole index
+                tags = photo.tags if photo is not None else list(self._tag_index)
+                for tag in tags:
+                    tagged = self._tag_index.get(tag)
+                    if tagged is not None:
+                        tagged.discard(photo_id)
+                        if not tagged:
+                            del self._tag_index[tag]
+            
+            return self._repository.delete(photo_id)
\ No newline at end of file
@@ -1,16 +1,226 @@
+import functools
+import io
+import itertools
 import os
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import uuid
-import re
 import shutil
-from datetime import datetime
-from typing import List, Optional, Set, Dict, Tuple
+from typing import Iterable, Iterator, List, Optional, Set, Dict, Tuple
+from xml.parsers import expat
 
-import exif
 from PIL import Image
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
 from src.domain.models.photo import Photo
 from src.domain.repositories.photo_repository import PhotoRepository
 
+# Linux ioctl that makes dst share src's extents on CoW filesystems (Btrfs, XFS)
+_FICLONE = 0x40049409
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """
+    Copy a file with data and metadata, avoiding user-space byte copies.
+    
+    Tries, in order, a copy-on-write clone (FICLONE) and an in-kernel
+    os.copy_file_range, then falls back to shutil.copy2.
+    
+    Args:
+        src (str): Source file path
+        dst (str): Destination file path
+    
+    Raises:
+        shutil.SameFileError: If src and dst are the same file
+    """
+    # Opening dst for writing would truncate src when they are the same file
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    
+    copied = False
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                copied = True
+            except OSError:
+                pass
+        
+        if not copied and hasattr(os, 'copy_file_range'):
+            try:
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    written = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if written == 0:
+                        break
+                    remaining -= written
+                copied = remaining == 0
+            except OSError:
+                pass
+    
+    if copied:
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+
+# Namespaces used in XMP files
+XMP_NAMESPACES = {
+    'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
+    'exif': 'http://ns.adobe.com/exif/1.0/',
+    'tiff': 'http://ns.adobe.com/tiff/1.0/',
+    'xmp': 'http://ns.adobe.com/xap/1.0/',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'xmpRights': 'http://ns.adobe.com/xap/1.0/rights/',
+    'lr': 'http://ns.adobe.com/lightroom/1.0/',
+    'crs': 'http://ns.adobe.com/camera-raw-settings/1.0/'
+}
+
+# Elements whose text is read from XMP files, keyed by the
+# "<namespace> <local name>" form expat reports with namespace processing on
+_XMP_TEXT_ELEMENTS = {
+    f"{XMP_NAMESPACES['tiff']} Model": 'model',
+    f"{XMP_NAMESPACES['exif']} GPSLatitude": 'latitude',
+    f"{XMP_NAMESPACES['exif']} GPSLongitude": 'longitude',
+    f"{XMP_NAMESPACES['xmp']} CreateDate": 'create_date',
+}
+
+
+class _XmpElementsFound(Exception):
+    """Raised from expat handlers to stop parsing once all elements are read."""
+
+
+def _read_xmp_texts(xmp_path: str) -> Dict[str, str]:
+    """
+    Stream an XMP file and collect the text of the elements of interest.
+    
+    Only the first occurrence of each element is read, and only its text
+    before any child element, matching ElementTree's find().text. Parsing
+    stops as soon as every element has been seen.
+    
+    Args:
+        xmp_path (str): Path to the XMP file
+    
+    Returns:
+        Dict[str, str]: Element text keyed by the names in _XMP_TEXT_ELEMENTS
+    """
+    texts = {}
+    chunks = []
+    current = None
+    
+    def start_element(name, attributes):
+        nonlocal current
+        if current is not None:
+            # A child element ends the text of its parent
+            texts[current] = ''.join(chunks)
+            current = None
+        key = _XMP_TEXT_ELEMENTS.get(name)
+        if key is not None and key not in texts:
+            current = key
+            chunks.clear()
+    
+    def character_data(data):
+        if current is not None:
+            chunks.append(data)
+    
+    def end_element(name):
+        nonlocal current
+        if current is not None:
+            texts[current] = ''.join(chunks)
+            current = None
+        if len(texts) == len(_XMP_TEXT_ELEMENTS):
+            raise _XmpElementsFound
+    
+    parser = expat.ParserCreate(namespace_separator=' ')
+    parser.StartElementHandler = start_element
+    parser.CharacterDataHandler = character_data
+    parser.EndElementHandler = end_element
+    
+    try:
+        with open(xmp_path, 'rb') as f:
+            parser.ParseFile(f)
+    except _XmpElementsFound:
+        pass
+    
+    return texts
+
+# EXIF lives in the first few KB of JPEGs; read at most this much up front
+_EXIF_HEADER_BYTES = 128 * 1024
+
+
+def _exif_values(img: Image.Image) -> dict:
+    """
+    Collect the camera model and raw GPS tags from an opened image.
+    
+    Args:
+        img (Image.Image): Opened image
+    
+    Returns:
+        dict: Raw EXIF values keyed by 'model', 'gps_latitude',
+            'gps_latitude_ref', 'gps_longitude' and 'gps_longitude_ref'
+    """
+    values = {}
+    exif_data = img.getexif()
+    
+    model = exif_data.get(0x0110)
+    if model:
+        values['model'] = model
+    
+    # GPSInfo IFD: 1/2 = latitude ref/value, 3/4 = longitude ref/value
+    gps = exif_data.get_ifd(0x8825)
+    if 2 in gps and 4 in gps:
+        values['gps_latitude'] = gps[2]
+        values['gps_latitude_ref'] = gps.get(1)
+        values['gps_longitude'] = gps[4]
+        values['gps_longitude_ref'] = gps.get(3)
+    
+    return values
+
+
+@functools.lru_cache(maxsize=4096)
+def _read_exif(file_path: str, mtime_ns: int) -> dict:
+    """
+    Read the camera model and raw GPS tags from an image's EXIF block.
+    
+    Only the leading _EXIF_HEADER_BYTES of the file are read, in a single
+    unbuffered read, and parsed from memory. Formats whose EXIF lies
+    further in (some TIFF-based RAWs) fall back to opening the full file.
+    Results are memoized per (path, mtime_ns) so a file is parsed at most
+    once while it is unchanged.
+    
+    Args:
+        file_path (str): Path to the image
+        mtime_ns (int): File modification time in nanoseconds, used as cache key
+    
+    Returns:
+        dict: Raw EXIF values keyed by 'model', 'gps_latitude',
+            'gps_latitude_ref', 'gps_longitude' and 'gps_longitude_ref'
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        header = f.read(_EXIF_HEADER_BYTES)
+    
+    try:
+        with Image.open(io.BytesIO(header)) as img:
+            return _exif_values(img)
+    except (OSError, SyntaxError, ValueError):
+        if len(header) < _EXIF_HEADER_BYTES:
+            # The whole file was already read; a retry cannot do better
+            raise
+    
+    with Image.open(file_path) as img:
+        return _exif_values(img)
+
+
 class FilesystemPhotoRepository(PhotoRepository):
     """
     Concrete implementation of PhotoRepository for filesystem-based photo management.
@@ -28,19 +238,104 @@ class FilesystemPhotoRepository(PhotoRepository):
     # All supported file extensions
     SUPPORTED_FORMATS = RAW_FORMATS + JPEG_FORMATS + LIVE_PHOTO_FORMATS + SIDECAR_FORMATS
     
-    def __init__(self, base_directory: str):
+    # Hashed variants for per-entry membership tests in directory scans
+    RAW_FORMATS_SET = frozenset(RAW_FORMATS)
+    JPEG_FORMATS_SET = frozenset(JPEG_FORMATS)
+    LIVE_PHOTO_FORMATS_SET = frozenset(LIVE_PHOTO_FORMATS)
+    SIDECAR_FORMATS_SET = frozenset(SIDECAR_FORMATS)
+    SUPPORTED_FORMATS_SET = frozenset(SUPPORTED_FORMATS)
+    # File types of sidecars tied to a specific file, keyed by their compound
+    # extension (e.g. image.nef.xmp)
+    SIDECAR_FILE_TYPES = {
+        **{f"{ext}.xmp": 'raw_sidecar' for ext in RAW_FORMATS},
+        **{f"{ext}.xmp": 'jpeg_sidecar' for ext in JPEG_FORMATS},
+    }
+    
+    # Number of directory listings kept by _scan_directory
+    LISTING_CACHE_SIZE = 16
+    
+    # save() rewrites file_path to the copied location, so callers must wait for it
+    supports_client_ids = False
+    
+    def __init__(self, base_directory: str, max_workers: Optional[int] = None):
         """
         Initialize the repository with a base directory for photo storage.
         
         Args:
             base_directory (str): Root directory for storing and managing photos
+            max_workers (Optional[int]): Threads used to read photo metadata
+                concurrently; lower it for spinning disks to avoid seek thrashing
         """
         self.base_directory = os.path.abspath(base_directory)
         os.makedirs(self.base_directory, exist_ok=True)
         
+        # Metadata reads are I/O-bound, so oversubscribe the CPUs
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        
+        # Directory listings as (mtime_ns, entries) keyed by directory, oldest
+        # first, so writes can invalidate just the directories they touch
+        self._listings: Dict[str, Tuple[int, Tuple[Tuple[str, str, bool], ...]]] = {}
+        self._listings_lock = threading.Lock()
+        
         # Cache directory for metadata
         self.metadata_dir = os.path.join(self.base_directory, '.metadata')
         os.makedirs(self.metadata_dir, exist_ok=True)
+        
+        # Related-file records live in a single SQLite index rather than one
+        # small file per photo. The connection is shared across threads, so
+        # every use goes through _index_lock.
+        self._index_lock = threading.Lock()
+        self._index = sqlite3.connect(
+            os.path.join(self.metadata_dir, 'index.sqlite'),
+            check_same_thread=False
+        )
+        with self._index_lock, self._index:
+            self._index.execute("PRAGMA journal_mode=WAL")
+            self._index.execute("PRAGMA synchronous=NORMAL")
+            self._index.execute(
+                "CREATE TABLE IF NOT EXISTS photos ("
+                "id TEXT NOT NULL, file_type TEXT NOT NULL, path TEXT NOT NULL, "
+                "PRIMARY KEY (id, file_type))"
+            )
+        self._migrate_meta_files()
+
+    def close(self) -> None:
+        """
+        Close the metadata index.
+        """
+        with self._index_lock:
+            self._index.close()
+
+    def _migrate_meta_files(self) -> None:
+        """
+        Move legacy per-photo .meta files into the SQLite index.
+        """
+        rows = []
+        migrated = []
+        
+        with os.scandir(self.metadata_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.meta'):
+                    continue
+                
+                photo_id = os.path.splitext(entry.name)[0]
+                with open(entry.path, 'r') as f:
+                    for line in f:
+                        if ':' in line:
+                            file_type, file_path = line.strip().split(':', 1)
+                            rows.append((photo_id, file_type, file_path))
+                migrated.append(entry.path)
+        
+        if not migrated:
+            return
+        
+        with self._index_lock, self._index:
+            self._index.executemany(
+                "INSERT OR REPLACE INTO photos VALUES (?, ?, ?)", rows
+            )
+        
+        for meta_path in migrated:
+            os.remove(meta_path)
 
     def _get_file_group_key(self, filename: str) -> str:
         """
@@ -53,16 +348,94 @@ class FilesystemPhotoRepository(PhotoRepository):
             str: Base name for grouping related files
         """
         # Extract base name without extension
-        base_name = os.path.splitext(filename)[0]
+        return self._group_key_from_stem(os.path.splitext(filename)[0])
+
+    def _group_key_from_stem(self, stem: str) -> str:
+        """
+        Derive the group key from a filename whose extension is already removed.
+        
+        Args:
+            stem (str): Filename without its final extension
+        
+        Returns:
+            str: Base name for grouping related files
+        """
+        base_name = stem
+        
+        # Plain suffix checks instead of regex substitutions; this runs once
+        # per directory entry on every scan.
         
         # Handle special case for Live Photos with suffix
-        base_name = re.sub(r'\.live$', '', base_name)
+        if base_name.endswith('.live'):
+            base_name = base_name[:-5]
         
         # Handle sidecar files that might have compound extensions (e.g., image.dng.xmp)
-        base_name = re.sub(r'\.(xmp|xml|plist|json)$', '', base_name)
+        if base_name.endswith(self.SIDECAR_FORMATS):
+            base_name = base_name[:base_name.rfind('.')]
         
         return base_name
 
+    def _scan_directory(self, directory: str) -> Tuple[Tuple[str, str, bool], ...]:
+        """
+        List a directory, reusing the previous listing while it is unchanged.
+        
+        Only names and file types are kept; per-file stat results would go
+        stale without the directory's mtime changing.
+        
+        Args:
+            directory (str): Directory to list
+            
+        Returns:
+            Tuple[Tuple[str, str, bool], ...]: (name, path, is_file) per entry
+        """
+        mtime_ns = os.stat(directory).st_mtime_ns
+        with self._listings_lock:
+            cached = self._listings.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        with os.scandir(directory) as entries:
+            listing = tuple((entry.name, entry.path, entry.is_file()) for entry in entries)
+        
+        with self._listings_lock:
+            self._listings.pop(directory, None)
+            self._listings[directory] = (mtime_ns, listing)
+            if len(self._listings) > self.LISTING_CACHE_SIZE:
+                del self._listings[next(iter(self._listings))]
+        
+        return listing
+
+    def _invalidate_listings(self, file_paths: Iterable[str]) -> None:
+        """
+        Drop the cached listings of the directories holding changed files.
+        
+        Directory mtimes can be too coarse to notice back-to-back changes, so
+        writes invalidate the directories they touch explicitly.
+        
+        Args:
+            file_paths (Iterable[str]): Paths of files that were written or removed
+        """
+        directories = {os.path.dirname(path) for path in file_paths}
+        with self._listings_lock:
+            for directory in directories:
+                self._listings.pop(directory, None)
+
+    def _sidecar_file_type(self, filename: str) -> str:
+        """
+        Classify a sidecar file by its compound extension.
+        
+        Args:
+            filename (str): Name of the sidecar file
+            
+        Returns:
+            str: 'raw_sidecar', 'jpeg_sidecar' or the generic 'sidecar'
+        """
+        parts = filename.rsplit('.', 2)
+        if len(parts) < 3:
+            return 'sidecar'
+        
+        return self.SIDECAR_FILE_TYPES.get(f".{parts[1]}.{parts[2]}", 'sidecar')
+
     def _find_related_files(self, base_path: str) -> Dict[str, str]:
         """
         Find all files related to a given base path (different formats of same photo).
@@ -78,31 +451,31 @@ class FilesystemPhotoRepository(PhotoRepository):
         
         related_files = {}
         
-        # Look for files with same base name but different extensions
-        for file in os.listdir(directory):
-            file_path = os.path.join(directory, file)
-            if os.path.isfile(file_path):
-                current_base = self._get_file_group_key(file)
-                ext = os.path.splitext(file)[1].lower()
+        # Look for files with same base name but different extensions.
+        # The listing keeps each entry's type, avoiding a stat per file.
+        for file, path, is_file in self._scan_directory(directory):
+            if is_file:
+                # Split the name once and reuse it for every check below
+                dot = file.rfind('.')
+                if dot <= 0:
+                    continue
+                ext = file[dot:].lower()
                 
-                if current_base == base_name and ext in self.SUPPORTED_FORMATS:
+                if (
+                    ext in self.SUPPORTED_FORMATS_SET
+                    and self._group_key_from_stem(file[:dot]) == base_name
+                ):
                     # Categorize by file type
-                    if ext in self.RAW_FORMATS:
-                        related_files['raw'] = file_path
-                    elif ext in self.JPEG_FORMATS:
-                        related_files['jpeg'] = file_path
-                    elif ext in self.LIVE_PHOTO_FORMATS:
-                        related_files['live'] = file_path
-                    elif ext in self.SIDECAR_FORMATS:
-                        # Check which format this sidecar belongs to
-                        sidecar_full_name = os.path.basename(file_path)
-                        if any(sidecar_full_name.endswith(f"{raw_ext}.xmp") for raw_ext in self.RAW_FORMATS):
-                            related_files['raw_sidecar'] = file_path
-                        elif any(sidecar_full_name.endswith(f"{jpeg_ext}.xmp") for jpeg_ext in self.JPEG_FORMATS):
-                            related_files['jpeg_sidecar'] = file_path
-                        else:
-                            # Generic sidecar that applies to the entire photo
-                            related_files['sidecar'] = file_path
+                    if ext in self.RAW_FORMATS_SET:
+                        related_files['raw'] = path
+                    elif ext in self.JPEG_FORMATS_SET:
+                        related_files['jpeg'] = path
+                    elif ext in self.LIVE_PHOTO_FORMATS_SET:
+                        related_files['live'] = path
+                    elif ext in self.SIDECAR_FORMATS_SET:
+                        # Check which format this sidecar belongs to; generic
+                        # sidecars apply to the entire photo
+                        related_files[self._sidecar_file_type(file)] = path
         
         return related_files
 
@@ -124,7 +497,7 @@ class FilesystemPhotoRepository(PhotoRepository):
     def _extract_photo_metadata(self, file_paths: Dict[str, str]) -> dict:
         """
         Extract metadata from the best available file representation.
-        First checks XMP sidecar files, then RAW, then JPEG, then Live Photo.
+        First checks XMP sidecar files, then JPEG, then RAW, then Live Photo.
         
         Args:
             file_paths (Dict[str, str]): Dictionary of available file paths by type
@@ -144,42 +517,47 @@ class FilesystemPhotoRepository(PhotoRepository):
                     if 'camera_model' in metadata and 'latitude' in metadata and 'longitude' in metadata:
                         return metadata
         
-        # Then try extracting from image files in order of preference
-        for file_type in ['raw', 'jpeg', 'live']:
+        # Then try extracting from image files in order of preference. The JPEG
+        # carries the same EXIF as its RAW twin and is far cheaper to parse,
+        # so RAW files are only read when no JPEG could be parsed.
+        for file_type in ['jpeg', 'raw', 'live']:
             if file_type in file_paths:
                 try:
                     file_path = file_paths[file_type]
                     
                     # Only attempt EXIF extraction on RAW and JPEG
                     if file_type in ['raw', 'jpeg']:
-                        with open(file_path, 'rb') as img_file:
-                            img = exif.Image(img_file)
-                            
-                            # Extract camera model
-                            if hasattr(img, 'model'):
-                                metadata['camera_model'] = img.model
+                        exif_values = _read_exif(
+                            file_path, os.stat(file_path).st_mtime_ns
+                        )
+                        
+                        # Extract camera model
+                        if 'model' in exif_values:
+                            metadata['camera_model'] = exif_values['model']
+                        
+                        # Extract GPS coordinates if available
+                        if 'gps_latitude' in exif_values:
+                            # Convert GPS coordinates to decimal degrees
+                            lat = self._convert_gps_coordinates(
+                                exif_values['gps_latitude'], 
+                                exif_values['gps_latitude_ref']
+                            )
+                            lon = self._convert_gps_coordinates(
+                                exif_values['gps_longitude'], 
+                                exif_values['gps_longitude_ref']
+                            )
                             
-                            # Extract GPS coordinates if available
-                            if (hasattr(img, 'gps_latitude') and 
-                                hasattr(img, 'gps_longitude')):
-                                # Convert GPS coordinates to decimal degrees
-                                lat = self._convert_gps_coordinates(
-                                    img.gps_latitude, 
-                                    img.gps_latitude_ref
-                                )
-                                lon = self._convert_gps_coordinates(
-                                    img.gps_longitude, 
-                                    img.gps_longitude_ref
-                                )
-                                
-                                metadata['latitude'] = lat
-                                metadata['longitude'] = lon
+                            metadata['latitude'] = lat
+                            metadata['longitude'] = lon
+                        
+                        if file_type == 'jpeg':
+                            break
                     
                     # If we found useful metadata, we can stop looking
                     if metadata.get('camera_model') and metadata.get('latitude') and metadata.get('longitude'):
                         break
                         
-                except (AttributeError, IOError, ValueError):
+                except (AttributeError, IOError, ValueError, SyntaxError):
                     # Continue to the next file type if extraction fails
                     continue
         
@@ -198,38 +576,19 @@ class FilesystemPhotoRepository(PhotoRepository):
         metadata = {}
         
         try:
-            import xml.etree.ElementTree as ET
-            
-            # Define namespaces used in XMP files
-            namespaces = {
-                'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
-                'exif': 'http://ns.adobe.com/exif/1.0/',
-                'tiff': 'http://ns.adobe.com/tiff/1.0/',
-                'xmp': 'http://ns.adobe.com/xap/1.0/',
-                'dc': 'http://purl.org/dc/elements/1.1/',
-                'xmpRights': 'http://ns.adobe.com/xap/1.0/rights/',
-                'lr': 'http://ns.adobe.com/lightroom/1.0/',
-                'crs': 'http://ns.adobe.com/camera-raw-settings/1.0/'
-            }
-            
-            # Parse the XMP file
-            tree = ET.parse(xmp_path)
-            root = tree.getroot()
+            # Stream the XMP file for the few elements needed
+            texts = _read_xmp_texts(xmp_path)
             
             # Extract camera model from tiff:Model
-            model_element = root.find(".//tiff:Model", namespaces)
-            if model_element is not None and model_element.text:
-                metadata['camera_model'] = model_element.text
+            if texts.get('model'):
+                metadata['camera_model'] = texts['model']
             
             # Extract GPS data
-            lat_element = root.find(".//exif:GPSLatitude", namespaces)
-            lon_element = root.find(".//exif:GPSLongitude", namespaces)
+            lat_text = texts.get('latitude')
+            lon_text = texts.get('longitude')
             
-            if lat_element is not None and lat_element.text and lon_element is not None and lon_element.text:
+            if lat_text and lon_text:
                 # Parse the GPS coordinates (typically in format like "38,41.9N")
-                lat_text = lat_element.text
-                lon_text = lon_element.text
-                
                 # Simple parsing, would need to be expanded for all possible formats
                 try:
                     # Handle formats like "38,41.9N"
@@ -256,10 +615,9 @@ class FilesystemPhotoRepository(PhotoRepository):
                     pass
             
             # Extract capture date
-            date_element = root.find(".//xmp:CreateDate", namespaces)
-            if date_element is not None and date_element.text:
+            if texts.get('create_date'):
                 # Store date info for potential use (format varies)
-                metadata['capture_date'] = date_element.text
+                metadata['capture_date'] = texts['create_date']
             
         except Exception as e:
             # If XMP parsing fails for any reason, just return empty metadata
@@ -294,6 +652,20 @@ class FilesystemPhotoRepository(PhotoRepository):
         except (TypeError, ValueError):
             return None
 
+    def _ctime_ns(self, file_path: str) -> int:
+        """
+        Get a file's change time.
+        
+        Args:
+            file_path (str): Path to the file
+            
+        Returns:
+            int: Change time in nanoseconds
+        """
+        # Stat the file on every build: cached listings would hand back stale
+        # ctimes, and on POSIX a fresh DirEntry.stat() is a syscall anyway
+        return os.stat(file_path).st_ctime_ns
+
     def _get_primary_file_path(self, file_paths: Dict[str, str]) -> str:
         """
         Determine the primary file path for a photo from its related files.
@@ -362,11 +734,14 @@ class FilesystemPhotoRepository(PhotoRepository):
                 
                 # Copy the file to the repository directory
                 try:
-                    shutil.copy2(file_path, destination_path)
+                    _fast_copy(file_path, destination_path)
                     saved_files[file_type] = destination_path
                 except IOError as e:
                     raise IOError(f"Failed to save {file_type} file: {e}")
         
+        # Only the destination directory changed; source listings stay cached
+        self._invalidate_listings(saved_files.values())
+        
         # Update primary file path in photo
         if saved_files:
             photo.file_path = self._get_primary_file_path(saved_files)
@@ -384,11 +759,15 @@ class FilesystemPhotoRepository(PhotoRepository):
             photo_id (uuid.UUID): Photo ID
             files (Dict[str, str]): Dictionary mapping file types to paths
         """
-        metadata_path = os.path.join(self.metadata_dir, f"{photo_id}.meta")
+        key = str(photo_id)
         
-        with open(metadata_path, 'w') as f:
-            for file_type, file_path in files.items():
-                f.write(f"{file_type}:{file_path}\n")
+        # Replace the whole record set, as rewriting a .meta file used to
+        with self._index_lock, self._index:
+            self._index.execute("DELETE FROM photos WHERE id = ?", (key,))
+            self._index.executemany(
+                "INSERT INTO photos VALUES (?, ?, ?)",
+                [(key, file_type, file_path) for file_type, file_path in files.items()]
+            )
 
     def _load_related_files_metadata(self, photo_id: uuid.UUID) -> Dict[str, str]:
         """
@@ -400,17 +779,13 @@ class FilesystemPhotoRepository(PhotoRepository):
         Returns:
             Dict[str, str]: Dictionary mapping file types to paths
         """
-        metadata_path = os.path.join(self.metadata_dir, f"{photo_id}.meta")
-        related_files = {}
-        
-        if os.path.exists(metadata_path):
-            with open(metadata_path, 'r') as f:
-                for line in f:
-                    if ':' in line:
-                        file_type, file_path = line.strip().split(':', 1)
-                        related_files[file_type] = file_path
+        with self._index_lock:
+            rows = self._index.execute(
+                "SELECT file_type, path FROM photos WHERE id = ? ORDER BY rowid",
+                (str(photo_id),)
+            ).fetchall()
         
-        return related_files
+        return dict(rows)
 
     def find_by_id(self, photo_id: uuid.UUID) -> Optional[Photo]:
         """
@@ -425,11 +800,12 @@ class FilesystemPhotoRepository(PhotoRepository):
         # Try to load from metadata first
         related_files = self._load_related_files_metadata(photo_id)
         
-        # If not found in metadata, try to find in the filesystem
+        # If not found in metadata, probe the names save() would have used
+        # instead of listing the whole base directory
         if not related_files:
-            for filename in os.listdir(self.base_directory):
-                if str(photo_id) in filename and os.path.splitext(filename)[1].lower() in self.SUPPORTED_FORMATS:
-                    full_path = os.path.join(self.base_directory, filename)
+            for ext in self.SUPPORTED_FORMATS:
+                full_path = os.path.join(self.base_directory, f"{photo_id}{ext}")
+                if os.path.lexists(full_path):
                     related_files = self._find_related_files(full_path)
                     break
                     
@@ -437,8 +813,29 @@ class FilesystemPhotoRepository(PhotoRepository):
         if not related_files:
             return None
             
+        return self._photo_from_related(photo_id, related_files)
+
+    def _photo_from_related(
+        self,
+        photo_id: uuid.UUID,
+        related_files: Dict[str, str],
+        metadata: Optional[dict] = None
+    ) -> Optional[Photo]:
+        """
+        Build a photo from its group of related files.
+        
+        Args:
+            photo_id (UUID): Unique identifier of the photo
+            related_files (Dict[str, str]): Mapping of file types to file paths
+            metadata (Optional[dict]): Metadata already extracted from the
+                files; extracted here when omitted
+        
+        Returns:
+            Optional[Photo]: Built photo or None if it has no primary file
+        """
         # Extract metadata
-        metadata = self._extract_photo_metadata(related_files)
+        if metadata is None:
+            metadata = self._extract_photo_metadata(related_files)
         
         # Get primary file
         primary_file_path = self._get_primary_file_path(related_files)
@@ -451,9 +848,7 @@ class FilesystemPhotoRepository(PhotoRepository):
             return Photo(
                 id=photo_id,
                 file_path=primary_file_path,
-                capture_timestamp=datetime.fromtimestamp(
-                    os.path.getctime(primary_file_path)
-                ),
+                capture_timestamp_ns=self._ctime_ns(primary_file_path),
                 camera_model=metadata.get('camera_model'),
                 latitude=metadata.get('latitude'),
                 longitude=metadata.get('longitude')
@@ -462,7 +857,7 @@ class FilesystemPhotoRepository(PhotoRepository):
             print(f"Error creating photo object: {e}")
             return None
 
-    def find_by_tag(self, tag: str) -> List[Photo]:
+    def iter_by_tag(self, tag: str) -> Iterator[Photo]:
         """
         Find photos by tag. Note: Tags are not natively supported by filesystem.
         This is a placeholder for potential future implementation.
@@ -471,10 +866,10 @@ class FilesystemPhotoRepository(PhotoRepository):
             tag (str): Tag to search for
         
         Returns:
-            List[Photo]: List of photos matching the tag
+            Iterator[Photo]: Photos matching the tag
         """
         # Future implementation could involve a separate metadata store
-        return []
+        return iter(())
 
     def delete(self, photo_id: uuid.UUID) -> bool:
         """
@@ -502,12 +897,13 @@ class FilesystemPhotoRepository(PhotoRepository):
             except OSError:
                 success = False
         
-        # Delete metadata file
+        self._invalidate_listings(related_files.values())
+        
+        # Delete metadata records
         try:
-            metadata_path = os.path.join(self.metadata_dir, f"{photo_id}.meta")
-            if os.path.exists(metadata_path):
-                os.remove(metadata_path)
-        except OSError:
+            with self._index_lock, self._index:
+                self._index.execute("DELETE FROM photos WHERE id = ?", (str(photo_id),))
+        except sqlite3.Error:
             success = False
         
         return success
@@ -573,129 +969,175 @@ class FilesystemPhotoRepository(PhotoRepository):
                             os.rename(new_p, original_p)
                         except OSError:
                             pass
+                    self._invalidate_listings(related_files.values())
                     return None
         
+        self._invalidate_listings(related_files.values())
+        
         # Update metadata
         self._save_related_files_metadata(photo_id, new_paths)
         
         # Return updated photo
         return self.find_by_id(photo_id)
 
-    def list_photos(self) -> List[Photo]:
+    def list_photos(self) -> Iterator[Photo]:
         """
         List all photos in the repository, grouping related files.
         
+        Photos are yielded as soon as each group is complete, so callers can
+        start consuming them before the whole directory has been processed.
+        
         Returns:
-            List[Photo]: All photos in the repository
+            Iterator[Photo]: All photos in the repository
         """
-        photos = []
-        processed_ids = set()
-        
-        # First check metadata directory for known photo IDs
-        for meta_file in os.listdir(self.metadata_dir):
-            if meta_file.endswith('.meta'):
-                photo_id_str = os.path.splitext(meta_file)[0]
-                try:
-                    photo_id = uuid.UUID(photo_id_str)
-                    photo = self.find_by_id(photo_id)
+        # Extract metadata concurrently with a bounded number of groups in
+        # flight; the reads are dominated by file I/O
+        in_flight = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for photo_id, files in self._iter_photo_groups():
+                future = executor.submit(self._extract_photo_metadata, files)
+                in_flight.append((photo_id, files, future))
+                
+                if len(in_flight) >= self.max_workers * 2:
+                    photo = self._build_listed_photo(*in_flight.popleft())
                     if photo:
-                        photos.append(photo)
-                        processed_ids.add(photo_id)
-                except ValueError:
-                    # Invalid UUID, skip
-                    continue
+                        yield photo
+            
+            while in_flight:
+                photo = self._build_listed_photo(*in_flight.popleft())
+                if photo:
+                    yield photo
+
+    def _iter_photo_groups(
+        self
+    ) -> Iterator[Tuple[Optional[uuid.UUID], Dict[str, str]]]:
+        """
+        Yield the file groups of all photos with a primary file, indexed ones first.
         
-        # Then scan the directory for any untracked photos
-        file_groups = {}
+        Returns:
+            Iterator[Tuple[Optional[UUID], Dict[str, str]]]: (photo ID, mapping
+                of file types to file paths) per group; the ID is None for
+                groups not in the index yet
+        """
+        processed_ids: Set[str] = set()
         
-        for filename in os.listdir(self.base_directory):
-            if os.path.splitext(filename)[1].lower() in self.SUPPORTED_FORMATS:
-                # Skip files we already processed through metadata
-                file_path = os.path.join(self.base_directory, filename)
-                
-                # Try to extract UUID from filename
-                try:
-                    potential_id = uuid.UUID(os.path.splitext(filename)[0])
-                    if potential_id in processed_ids:
-                        continue
-                except ValueError:
-                    # Not a UUID-named file, proceed with grouping
-                    pass
-                
-                # Skip sidecar files as entry points - they'll be found through their primary files
-                if os.path.splitext(filename)[1].lower() in self.SIDECAR_FORMATS:
-                    continue
-                
-                base_name = self._get_file_group_key(filename)
-                
-                if base_name not in file_groups:
-                    file_groups[base_name] = {}
-                
-                ext = os.path.splitext(filename)[1].lower()
-                if ext in self.RAW_FORMATS:
-                    file_groups[base_name]['raw'] = file_path
-                elif ext in self.JPEG_FORMATS:
-                    file_groups[base_name]['jpeg'] = file_path
-                elif ext in self.LIVE_PHOTO_FORMATS:
-                    file_groups[base_name]['live'] = file_path
-        
-        # Second pass to find sidecar files for each group
-        for base_name in file_groups:
-            # Find all potential sidecar files
-            for filename in os.listdir(self.base_directory):
-                if os.path.splitext(filename)[1].lower() in self.SIDECAR_FORMATS:
-                    sidecar_base = self._get_file_group_key(filename)
-                    if sidecar_base == base_name:
-                        # This is a sidecar file for our group
-                        file_path = os.path.join(self.base_directory, filename)
-                        
-                        # Determine which file type this sidecar belongs to
-                        if 'raw' in file_groups[base_name] and any(
-                            f"{raw_ext}.xmp" in filename.lower() for raw_ext in self.RAW_FORMATS
-                        ):
-                            file_groups[base_name]['raw_sidecar'] = file_path
-                        elif 'jpeg' in file_groups[base_name] and any(
-                            f"{jpeg_ext}.xmp" in filename.lower() for jpeg_ext in self.JPEG_FORMATS
-                        ):
-                            file_groups[base_name]['jpeg_sidecar'] = file_path
-                        else:
-                            # Generic sidecar
-                            file_groups[base_name]['sidecar'] = file_path
+        # First read known photos from a single scan of the metadata index
+        with self._index_lock:
+            rows = self._index.execute(
+                "SELECT id, file_type, path FROM photos ORDER BY id, rowid"
+            ).fetchall()
         
-        # Create photo objects for each group
-        for base_name, files in file_groups.items():
-            if not files:  # Skip empty groups
+        for photo_id_str, group in itertools.groupby(rows, key=lambda row: row[0]):
+            try:
+                photo_id = uuid.UUID(photo_id_str)
+            except ValueError:
+                # Invalid UUID, skip
                 continue
-                
-            # Create a new UUID for this group
-            group_id = uuid.uuid4()
-            
-            # Get primary file path
-            primary_file_path = self._get_primary_file_path(files)
-            
-            if not primary_file_path:
+            related_files = {file_type: path for _, file_type, path in group}
+            if self._get_primary_file_path(related_files):
+                processed_ids.add(photo_id_str)
+                yield photo_id, related_files
+        
+        # Then scan the directory for any untracked photos. Entries are sorted
+        # by group key so each group's files are contiguous and the group can
+        # be processed as soon as its last file has been seen.
+        keyed_entries = []
+        for name, path, _ in self._scan_directory(self.base_directory):
+            # Split each name once; the stem and extension are reused below
+            dot = name.rfind('.')
+            if dot <= 0:
                 continue
-                
-            # Extract metadata
-            metadata = self._extract_photo_metadata(files)
+            ext = name[dot:].lower()
+            if ext in self.SUPPORTED_FORMATS_SET:
+                stem = name[:dot]
+                keyed_entries.append((self._group_key_from_stem(stem), stem, ext, name, path))
+        keyed_entries.sort(key=lambda keyed: keyed[0])
+        
+        for _, group in itertools.groupby(keyed_entries, key=lambda keyed: keyed[0]):
+            files = self._group_untracked_files(list(group), processed_ids)
             
-            # Save metadata for future reference
-            self._save_related_files_metadata(group_id, files)
+            # Skip groups without a primary file
+            if self._get_primary_file_path(files):
+                yield None, files
+
+    def _group_untracked_files(
+        self,
+        entries: List[Tuple[str, str, str, str, str]],
+        processed_ids: Set[str]
+    ) -> Dict[str, str]:
+        """
+        Map the files of one untracked group to their file types.
+        
+        Args:
+            entries (List[Tuple[str, str, str, str, str]]): (group key, stem,
+                extension, name, path) for each directory entry sharing a
+                group key
+            processed_ids (Set[str]): IDs of photos already listed from the index
+        
+        Returns:
+            Dict[str, str]: Mapping of file types to file paths, empty if the
+                group has no unprocessed primary file
+        """
+        files = {}
+        sidecars = []
+        
+        for _, stem, ext, filename, path in entries:
+            # Sidecar files are attached once the group's primary files are known
+            if ext in self.SIDECAR_FORMATS_SET:
+                sidecars.append((filename, path))
+                continue
             
-            try:
-                photo = Photo(
-                    id=group_id,
-                    file_path=primary_file_path,
-                    capture_timestamp=datetime.fromtimestamp(
-                        os.path.getctime(primary_file_path)
-                    ),
-                    camera_model=metadata.get('camera_model'),
-                    latitude=metadata.get('latitude'),
-                    longitude=metadata.get('longitude')
-                )
-                photos.append(photo)
-            except Exception:
-                # Skip files that can't be processed
+            # Skip files we already processed through metadata. IDs are
+            # kept as the strings save() names files with, so no UUID
+            # needs to be parsed per entry.
+            if stem in processed_ids:
                 continue
+            
+            if ext in self.RAW_FORMATS_SET:
+                files['raw'] = path
+            elif ext in self.JPEG_FORMATS_SET:
+                files['jpeg'] = path
+            elif ext in self.LIVE_PHOTO_FORMATS_SET:
+                files['live'] = path
+        
+        if not files:
+            return files
+        
+        for filename, file_path in sidecars:
+            # Determine which file type this sidecar belongs to, falling back
+            # to a generic sidecar when the group lacks that file
+            file_type = self._sidecar_file_type(filename.lower())
+            if file_type == 'raw_sidecar' and 'raw' not in files:
+                file_type = 'sidecar'
+            elif file_type == 'jpeg_sidecar' and 'jpeg' not in files:
+                file_type = 'sidecar'
+            files[file_type] = file_path
+        
+        return files
+
+    def _build_listed_photo(
+        self,
+        photo_id: Optional[uuid.UUID],
+        files: Dict[str, str],
+        metadata_future: Future
+    ) -> Optional[Photo]:
+        """
+        Create a listed photo, indexing groups found by the directory scan.
+        
+        Args:
+            photo_id (Optional[UUID]): ID of an indexed photo, or None for a
+                group not in the index yet
+            files (Dict[str, str]): Mapping of file types to file paths
+            metadata_future (Future): Pending metadata extraction for the group
+        
+        Returns:
+            Optional[Photo]: Created photo or None if it could not be built
+        """
+        metadata = metadata_future.result()
+        
+        if photo_id is None:
+            # Create a new UUID for this group and save metadata for future reference
+            photo_id = uuid.uuid4()
+            self._save_related_files_metadata(photo_id, files)
         
-        return photos
+        return self._photo_from_related(photo_id, files, metadata)
\ No newline at end of file